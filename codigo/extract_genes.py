@@ -8,12 +8,37 @@ anotaciones GFF. Las secuencias se guardan en un archivo FASTA de salida.
 Uso:
     python extract_genes.py --gff genes.gff --fasta genome.fasta --output genes.fna
     python extract_genes.py --gff genes.gff --fasta genome.fasta --output genes.fna --min-length 300
+    python extract_genes.py --gff genes.gff --fasta genome.fasta --output genes.fna --manifest genes.manifest.json
+    python extract_genes.py --gff genes.gff --fasta genome.fasta --output genes.fna --stats
 """
 
 import argparse
+import bisect
+import hashlib
+import json
+import re
+from collections import Counter
 from pathlib import Path
 
 
+# Versión del formato del manifiesto usado en el modo incremental
+MANIFEST_VERSION = 2
+
+# Codones de terminación (código genético estándar)
+STOP_CODONS = ('TAA', 'TAG', 'TGA')
+
+# Posiciones (con solapamiento) donde empieza un codón de terminación
+STOP_CODON_RE = re.compile(r'(?=TA[AG]|TGA)')
+
+# Columnas del resumen de estadísticas por gen
+STATS_COLUMNS = ('name', 'length', 'gc_content', 'n_count',
+                 'ends_with_stop', 'internal_stops')
+
+# Límites de los histogramas mostrados en el resumen de la CLI
+LENGTH_BINS = (0, 300, 1000, 3000, 10000)
+GC_BINS = (0.0, 0.3, 0.4, 0.5, 0.6)
+
+
 def load_fasta(fasta_path):
     """
     Carga un archivo FASTA y retorna un diccionario con las secuencias.
@@ -87,7 +112,8 @@ def parse_gff(gff_path):
     
     Returns:
         list: Lista de diccionarios con información de genes:
-              {'seqid': str, 'start': int, 'end': int, 'strand': str, 'name': str}
+              {'seqid': str, 'start': int, 'end': int, 'strand': str, 'name': str,
+               'id': str or None}
     
     Raises:
         FileNotFoundError: Si el archivo no existe.
@@ -150,15 +176,18 @@ def parse_gff(gff_path):
                         f"Must be '+' or '-'"
                     )
                 
-                # Extraer nombre del gen
+                # Extraer nombre e ID del gen (Name tiene prioridad sobre ID)
                 name = None
+                gene_id = None
                 for attr in attributes.split(';'):
                     attr = attr.strip()
-                    if attr.startswith('Name='):
+                    if attr.startswith('Name=') and name is None:
                         name = attr[5:]
-                        break
-                    elif attr.startswith('ID='):
-                        name = attr[3:]
+                    elif attr.startswith('ID=') and gene_id is None:
+                        gene_id = attr[3:]
+                
+                if name is None:
+                    name = gene_id
                 
                 if name is None:
                     raise ValueError(
@@ -170,7 +199,8 @@ def parse_gff(gff_path):
                     'start': start_int,
                     'end': end_int,
                     'strand': strand,
-                    'name': name
+                    'name': name,
+                    'id': gene_id
                 })
     
     except IOError as e:
@@ -196,7 +226,114 @@ def reverse_complement(seq):
     return ''.join(complement_map[base] for base in reversed(seq))
 
 
-def extract_gene_seqs(genome, genes, min_length=None):
+def gene_stats(name, seq):
+    """
+    Calcula métricas básicas de la secuencia de un gen.
+    
+    Args:
+        name (str): Nombre del gen.
+        seq (str): Secuencia de DNA del gen.
+    
+    Returns:
+        dict: Diccionario con formato {'name': str, 'length': int,
+              'gc_content': float, 'n_count': int, 'ends_with_stop': bool,
+              'internal_stops': int}.
+    """
+    length = len(seq)
+    gc_count = seq.count('G') + seq.count('C')
+    
+    # Codones de terminación en marco de lectura, excluyendo el último codón
+    internal_stops = sum(
+        1 for match in STOP_CODON_RE.finditer(seq, 0, max(length - 3, 0))
+        if match.start() % 3 == 0
+    )
+    
+    return {
+        'name': name,
+        'length': length,
+        'gc_content': gc_count / length if length else 0.0,
+        'n_count': seq.count('N'),
+        'ends_with_stop': length >= 3 and length % 3 == 0 and seq[-3:] in STOP_CODONS,
+        'internal_stops': internal_stops,
+    }
+
+
+def extract_gene_seq(genome, gene):
+    """
+    Extrae la secuencia de un único gen desde el genoma.
+    
+    Args:
+        genome (dict): Diccionario con secuencias del genoma.
+        gene (dict): Diccionario con información del gen.
+    
+    Returns:
+        tuple: Tupla (header, sequence) del gen.
+    
+    Raises:
+        ValueError: Si el seqid no existe o las coordenadas están fuera de rango.
+    """
+    seqid = gene['seqid']
+    start = gene['start'] - 1  # GFF es 1-indexed, Python es 0-indexed
+    end = gene['end']
+    strand = gene['strand']
+    name = gene['name']
+    
+    # Validar que el seqid existe en el genoma
+    if seqid not in genome:
+        raise ValueError(
+            f"Sequence '{seqid}' from GFF not found in FASTA. "
+            f"Available sequences: {', '.join(genome.keys())}"
+        )
+    
+    genome_seq = genome[seqid]
+    
+    # Validar que las coordenadas están dentro del rango
+    if start < 0 or end > len(genome_seq):
+        raise ValueError(
+            f"Gene '{name}' coordinates ({start+1}-{end}) are out of bounds "
+            f"for sequence '{seqid}' (length: {len(genome_seq)})"
+        )
+    
+    # Extraer la secuencia
+    gene_seq = genome_seq[start:end]
+    
+    # Aplicar reverse complement si es necesario
+    if strand == '-':
+        gene_seq = reverse_complement(gene_seq)
+    
+    return gene_header(gene), gene_seq
+
+
+def gene_header(gene):
+    """
+    Crea el encabezado FASTA de un gen.
+    
+    Args:
+        gene (dict): Diccionario con información del gen.
+    
+    Returns:
+        str: Encabezado con formato '>name gene_coords=start-end strand=s'.
+    """
+    return (f">{gene['name']} gene_coords={gene['start']}-{gene['end']} "
+            f"strand={gene['strand']}")
+
+
+def validate_min_length(min_length):
+    """
+    Valida el valor de min_length.
+    
+    Args:
+        min_length (int or None): Longitud mínima de genes a incluir.
+    
+    Raises:
+        ValueError: Si min_length no es un entero positivo.
+    """
+    if min_length is not None:
+        if not isinstance(min_length, int) or min_length < 0:
+            raise ValueError("--min-length must be a positive integer")
+
+
+def extract_gene_seqs(genome, genes, min_length=None, stats=None):
     """
     Extrae las secuencias de genes desde el genoma.
     
@@ -204,6 +341,8 @@ def extract_gene_seqs(genome, genes, min_length=None):
         genome (dict): Diccionario con secuencias del genoma.
         genes (list): Lista de diccionarios con información de genes.
         min_length (int, optional): Longitud mínima de genes a incluir. Defaults to None.
+        stats (list, optional): Si se proporciona, se le agregan las métricas
+            de cada gen extraído (ver gene_stats()). Defaults to None.
     
     Returns:
         list: Lista de tuplas (header, sequence) para cada gen.
@@ -211,50 +350,21 @@ def extract_gene_seqs(genome, genes, min_length=None):
     Raises:
         ValueError: Si las coordenadas están fuera de rango o si min_length es inválido.
     """
-    if min_length is not None:
-        if not isinstance(min_length, int) or min_length < 0:
-            raise ValueError("--min-length must be a positive integer")
+    validate_min_length(min_length)
     
     extracted = []
     
     for gene in genes:
-        seqid = gene['seqid']
-        start = gene['start'] - 1  # GFF es 1-indexed, Python es 0-indexed
-        end = gene['end']
-        strand = gene['strand']
-        name = gene['name']
-        
-        # Validar que el seqid existe en el genoma
-        if seqid not in genome:
-            raise ValueError(
-                f"Sequence '{seqid}' from GFF not found in FASTA. "
-                f"Available sequences: {', '.join(genome.keys())}"
-            )
-        
-        genome_seq = genome[seqid]
-        
-        # Validar que las coordenadas están dentro del rango
-        if start < 0 or end > len(genome_seq):
-            raise ValueError(
-                f"Gene '{name}' coordinates ({start+1}-{end}) are out of bounds "
-                f"for sequence '{seqid}' (length: {len(genome_seq)})"
-            )
-        
-        # Extraer la secuencia
-        gene_seq = genome_seq[start:end]
-        
-        # Aplicar reverse complement si es necesario
-        if strand == '-':
-            gene_seq = reverse_complement(gene_seq)
+        header, gene_seq = extract_gene_seq(genome, gene)
         
         # Aplicar filtro de longitud mínima
         if min_length is not None and len(gene_seq) < min_length:
             continue
         
-        # Crear encabezado FASTA
-        header = f">{name} gene_coords={start+1}-{end} strand={strand}"
-        
         extracted.append((header, gene_seq))
+        
+        if stats is not None:
+            stats.append(gene_stats(gene['name'], gene_seq))
     
     if not extracted:
         raise ValueError("No genes extracted. Check --min-length or GFF/FASTA files.")
@@ -262,6 +372,376 @@ def extract_gene_seqs(genome, genes, min_length=None):
     return extracted
 
 
+def write_fasta(output_path, records):
+    """
+    Escribe los registros (header, sequence) en un archivo FASTA.
+    
+    Args:
+        output_path (str): Ruta al archivo FASTA de salida.
+        records (list): Lista de tuplas (header, sequence).
+    
+    Returns:
+        list: Lista de tuplas (offset, length) en bytes de cada registro escrito.
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    offsets = []
+    position = 0
+    
+    with open(output_path, 'wb') as f:
+        for header, seq in records:
+            record = f"{header}\n{seq}\n".encode()
+            f.write(record)
+            offsets.append((position, len(record)))
+            position += len(record)
+    
+    return offsets
+
+
+def stats_path_for(output_path):
+    """
+    Calcula la ruta del resumen de estadísticas junto al FASTA de salida.
+    
+    Args:
+        output_path (str): Ruta al archivo FASTA de salida.
+    
+    Returns:
+        Path: Ruta con formato <output>.stats.tsv (p. ej. genes.fna.stats.tsv).
+    """
+    output_path = Path(output_path)
+    return output_path.with_name(output_path.name + '.stats.tsv')
+
+
+def write_stats(stats_path, stats):
+    """
+    Escribe las métricas por gen en un archivo TSV.
+    
+    Args:
+        stats_path (str): Ruta al archivo TSV de salida.
+        stats (list): Lista de diccionarios devueltos por gene_stats().
+    """
+    stats_path = Path(stats_path)
+    stats_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    tmp_path = stats_path.with_name(stats_path.name + '.tmp')
+    with open(tmp_path, 'w') as f:
+        f.write('\t'.join(STATS_COLUMNS) + '\n')
+        for row in stats:
+            f.write(
+                f"{row['name']}\t{row['length']}\t{row['gc_content']:.4f}\t"
+                f"{row['n_count']}\t{str(row['ends_with_stop']).lower()}\t"
+                f"{row['internal_stops']}\n"
+            )
+    tmp_path.replace(stats_path)
+
+
+def format_histogram(values, bins, fmt='{}', width=30):
+    """
+    Genera un histograma de texto para mostrar en la CLI.
+    
+    Args:
+        values (list): Valores a agrupar.
+        bins (tuple): Límites inferiores de cada intervalo, en orden creciente.
+        fmt (str, optional): Formato de los límites. Defaults to '{}'.
+        width (int, optional): Ancho máximo de las barras. Defaults to 30.
+    
+    Returns:
+        list: Lista de líneas del histograma.
+    """
+    counts = [0] * len(bins)
+    for value in values:
+        counts[max(bisect.bisect_right(bins, value) - 1, 0)] += 1
+    
+    labels = []
+    for i, low in enumerate(bins):
+        if i + 1 < len(bins):
+            labels.append(f"{fmt.format(low)}-{fmt.format(bins[i + 1])}")
+        else:
+            labels.append(f">={fmt.format(low)}")
+    
+    label_width = max(len(label) for label in labels)
+    peak = max(counts) or 1
+    
+    return [
+        f"{label:>{label_width}} | {'#' * round(width * count / peak):<{width}} {count}"
+        for label, count in zip(labels, counts)
+    ]
+
+
+def gene_key(gene):
+    """
+    Obtiene la clave de un gen en el manifiesto del modo incremental.
+    
+    Args:
+        gene (dict): Diccionario con información del gen.
+    
+    Returns:
+        str: El ID del gen en el GFF, o su nombre si no tiene ID.
+    """
+    return gene.get('id') or gene['name']
+
+
+def gene_fingerprint(gene):
+    """
+    Calcula un hash de las coordenadas, el strand y el nombre de un gen.
+    
+    Args:
+        gene (dict): Diccionario con información del gen.
+    
+    Returns:
+        str: Hash hexadecimal de (seqid, start, end, strand, name).
+    """
+    key = (f"{gene['seqid']}\t{gene['start']}\t{gene['end']}\t"
+           f"{gene['strand']}\t{gene['name']}")
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def file_fingerprint(path):
+    """
+    Calcula una huella ligera (tamaño y fecha de modificación) de un archivo.
+    
+    Args:
+        path (str): Ruta al archivo.
+    
+    Returns:
+        dict: Diccionario con formato {'size': int, 'mtime_ns': int}.
+    """
+    stat = Path(path).stat()
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def load_manifest(manifest_path):
+    """
+    Carga el manifiesto de una ejecución anterior.
+    
+    Args:
+        manifest_path (str): Ruta al archivo de manifiesto (JSON).
+    
+    Returns:
+        dict or None: Manifiesto cargado, o None si el archivo no existe, es de
+                      otra versión o tiene formato incorrecto.
+    
+    Raises:
+        ValueError: Si el manifiesto no se puede leer.
+    """
+    manifest_path = Path(manifest_path)
+    
+    if not manifest_path.exists():
+        return None
+    
+    try:
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+    except json.JSONDecodeError:
+        return None
+    except IOError as e:
+        raise ValueError(f"Error reading manifest file: {e}")
+    
+    if (not isinstance(manifest, dict)
+            or manifest.get('version') != MANIFEST_VERSION
+            or not isinstance(manifest.get('genes'), dict)):
+        return None
+    
+    for entry in manifest['genes'].values():
+        if (not isinstance(entry, dict)
+                or not isinstance(entry.get('hash'), str)
+                or not isinstance(entry.get('length'), int)
+                or not (entry.get('offset') is None
+                        or isinstance(entry.get('offset'), int))):
+            return None
+    
+    return manifest
+
+
+def save_manifest(manifest_path, manifest):
+    """
+    Guarda el manifiesto de la ejecución actual.
+    
+    Args:
+        manifest_path (str): Ruta al archivo de manifiesto (JSON).
+        manifest (dict): Manifiesto a guardar.
+    """
+    manifest_path = Path(manifest_path)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    tmp_path = manifest_path.with_name(manifest_path.name + '.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f)
+    tmp_path.replace(manifest_path)
+
+
+def diff_genes(genes, manifest):
+    """
+    Compara los genes del GFF actual con los del manifiesto anterior.
+    
+    Args:
+        genes (list): Lista de diccionarios con información de genes.
+        manifest (dict or None): Manifiesto de la ejecución anterior.
+    
+    Returns:
+        tuple: (added, changed, removed) donde added y changed son listas de
+               claves (ver gene_key()) de genes nuevos o modificados, y removed
+               es la lista de claves que ya no aparecen en el GFF.
+    """
+    previous = manifest['genes'] if manifest is not None else {}
+    
+    added = []
+    changed = []
+    for gene in genes:
+        key = gene_key(gene)
+        entry = previous.get(key)
+        if entry is None:
+            added.append(key)
+        elif entry['hash'] != gene_fingerprint(gene):
+            changed.append(key)
+    
+    current_keys = {gene_key(gene) for gene in genes}
+    removed = [key for key in previous if key not in current_keys]
+    
+    return added, changed, removed
+
+
+def extract_incremental(fasta_path, genes, output_path, manifest_path,
+                        min_length=None, stats=None):
+    """
+    Re-extrae solo los genes nuevos o modificados respecto a la ejecución
+    anterior y reconstruye el FASTA de salida reutilizando los registros sin
+    cambios.
+    
+    Los genes se identifican por su ID en el GFF (o por su nombre si no tienen
+    ID). Si el manifiesto no existe o no es válido, o el FASTA, el archivo de
+    salida o min_length cambiaron desde la ejecución anterior, se extraen todos
+    los genes. Cada registro reutilizado se verifica contra el encabezado y la
+    longitud esperados antes de copiarlo; si no coincide, el gen se re-extrae.
+    
+    Args:
+        fasta_path (str): Ruta al archivo FASTA del genoma.
+        genes (list): Lista de diccionarios con información de genes.
+        output_path (str): Ruta al archivo FASTA de salida.
+        manifest_path (str): Ruta al archivo de manifiesto (JSON).
+        min_length (int, optional): Longitud mínima de genes a incluir. Defaults to None.
+        stats (list, optional): Si se proporciona, se le agregan las métricas
+            de cada gen escrito, incluidos los reutilizados. Defaults to None.
+    
+    Returns:
+        dict: Resumen con formato {'added': int, 'changed': int, 'removed': int,
+              'reused': int, 'written': int}.
+    
+    Raises:
+        ValueError: Si hay IDs de genes duplicados, si el manifiesto no se
+                    puede leer o si no se extrae ningún gen.
+    """
+    validate_min_length(min_length)
+    
+    key_counts = Counter(gene_key(gene) for gene in genes)
+    duplicated = sorted(key for key, count in key_counts.items() if count > 1)
+    if duplicated:
+        raise ValueError(
+            f"Incremental mode requires unique gene IDs. "
+            f"Duplicated: {', '.join(duplicated)}"
+        )
+    
+    output_path = Path(output_path)
+    manifest = load_manifest(manifest_path)
+    
+    # Invalidar el manifiesto si cambió algo distinto del GFF
+    if manifest is not None and (
+            not output_path.exists()
+            or manifest.get('fasta') != file_fingerprint(fasta_path)
+            or manifest.get('min_length') != min_length
+            or manifest.get('output') != file_fingerprint(output_path)):
+        manifest = None
+    
+    added, changed, removed = diff_genes(genes, manifest)
+    to_extract = set(added) | set(changed)
+    
+    # El genoma se carga solo si hay genes que re-extraer
+    genome = None
+    previous = manifest['genes'] if manifest is not None else {}
+    
+    old_output = open(output_path, 'rb') if manifest is not None else None
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    entries = {}
+    position = 0
+    reused = 0
+    
+    try:
+        with open(tmp_path, 'wb') as f:
+            for gene in genes:
+                key = gene_key(gene)
+                extract = key in to_extract
+                record = None
+                
+                if not extract and previous[key]['offset'] is not None:
+                    entry = previous[key]
+                    old_output.seek(entry['offset'])
+                    record = old_output.read(entry['length'])
+                    
+                    # Verificar que el registro copiado corresponde al gen
+                    header = f"{gene_header(gene)}\n".encode()
+                    seq_length = gene['end'] - gene['start'] + 1
+                    if (len(record) == len(header) + seq_length + 1
+                            and record.startswith(header)
+                            and record.endswith(b'\n')):
+                        seq = record[len(header):-1].decode()
+                        reused += 1
+                    else:
+                        record = None
+                        extract = True
+                
+                if extract:
+                    if genome is None:
+                        genome = load_fasta(fasta_path)
+                    header, seq = extract_gene_seq(genome, gene)
+                    if min_length is None or len(seq) >= min_length:
+                        record = f"{header}\n{seq}\n".encode()
+                
+                if record is None:
+                    entries[key] = {'hash': gene_fingerprint(gene),
+                                    'offset': None, 'length': 0}
+                    continue
+                
+                f.write(record)
+                if stats is not None:
+                    stats.append(gene_stats(gene['name'], seq))
+                entries[key] = {'hash': gene_fingerprint(gene),
+                                'offset': position, 'length': len(record)}
+                position += len(record)
+    except Exception:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
+    finally:
+        if old_output is not None:
+            old_output.close()
+    
+    written = sum(1 for entry in entries.values() if entry['offset'] is not None)
+    if not written:
+        tmp_path.unlink()
+        raise ValueError("No genes extracted. Check --min-length or GFF/FASTA files.")
+    
+    tmp_path.replace(output_path)
+    
+    save_manifest(manifest_path, {
+        'version': MANIFEST_VERSION,
+        'fasta': file_fingerprint(fasta_path),
+        'min_length': min_length,
+        'output': file_fingerprint(output_path),
+        'genes': entries,
+    })
+    
+    return {
+        'added': len(added),
+        'changed': len(changed),
+        'removed': len(removed),
+        'reused': reused,
+        'written': written,
+    }
+
+
 def main():
     """
     Función principal que orquesta todo el flujo del programa.
@@ -274,6 +754,8 @@ def main():
 Examples:
     python extract_genes.py --gff genes.gff --fasta genome.fasta --output genes.fna
     python extract_genes.py --gff genes.gff --fasta genome.fasta --output genes.fna --min-length 300
+    python extract_genes.py --gff genes.gff --fasta genome.fasta --output genes.fna --manifest genes.manifest.json
+    python extract_genes.py --gff genes.gff --fasta genome.fasta --output genes.fna --stats
         """
     )
     
@@ -298,31 +780,84 @@ Examples:
         default=None,
         help='Minimum gene length to include (optional)'
     )
+    parser.add_argument(
+        '--manifest',
+        default=None,
+        help='Path to the run manifest (JSON). Enables incremental mode: only '
+             'genes added or changed since the previous run are re-extracted '
+             '(optional)'
+    )
+    parser.add_argument(
+        '--stats',
+        action='store_true',
+        help='Compute per-gene length, GC content, N count and stop-codon '
+             'checks, and write them to <output>.stats.tsv. Without this flag '
+             'an existing <output>.stats.tsv is removed (optional)'
+    )
     
     args = parser.parse_args()
+    stats = [] if args.stats else None
     
     try:
-        print(f"Loading FASTA from {args.fasta}...")
-        genome = load_fasta(args.fasta)
-        print(f"✓ Loaded {len(genome)} sequences")
-        
-        print(f"Parsing GFF from {args.gff}...")
-        genes = parse_gff(args.gff)
-        print(f"✓ Found {len(genes)} genes")
-        
-        print("Extracting gene sequences...")
-        extracted = extract_gene_seqs(genome, genes, args.min_length)
-        print(f"✓ Extracted {len(extracted)} genes")
+        if args.manifest is not None:
+            print(f"Parsing GFF from {args.gff}...")
+            genes = parse_gff(args.gff)
+            print(f"✓ Found {len(genes)} genes")
+            
+            print(f"Extracting gene sequences incrementally "
+                  f"(manifest: {args.manifest})...")
+            summary = extract_incremental(
+                args.fasta, genes, args.output, args.manifest, args.min_length,
+                stats
+            )
+            print(f"✓ {summary['added']} added, {summary['changed']} changed, "
+                  f"{summary['removed']} removed, {summary['reused']} reused")
+            print(f"✓ Extracted {summary['written']} genes")
+        else:
+            print(f"Loading FASTA from {args.fasta}...")
+            genome = load_fasta(args.fasta)
+            print(f"✓ Loaded {len(genome)} sequences")
+            
+            print(f"Parsing GFF from {args.gff}...")
+            genes = parse_gff(args.gff)
+            print(f"✓ Found {len(genes)} genes")
+            
+            print("Extracting gene sequences...")
+            extracted = extract_gene_seqs(genome, genes, args.min_length, stats)
+            print(f"✓ Extracted {len(extracted)} genes")
+            
+            # Escribir archivo de salida
+            write_fasta(args.output, extracted)
         
-        # Escribir archivo de salida
-        output_path = Path(args.output)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        print(f"✓ Saved to {args.output}")
         
-        with open(output_path, 'w') as f:
-            for header, seq in extracted:
-                f.write(f"{header}\n{seq}\n")
+        # Eliminar estadísticas de una ejecución anterior que ya no
+        # corresponden al FASTA recién escrito
+        stale_stats_path = stats_path_for(args.output)
+        if stats is None and stale_stats_path.exists():
+            stale_stats_path.unlink()
+            print(f"✓ Removed stale statistics {stale_stats_path}")
         
-        print(f"✓ Saved to {output_path}")
+        if stats is not None:
+            stats_path = stats_path_for(args.output)
+            write_stats(stats_path, stats)
+            print(f"✓ Saved statistics to {stats_path}")
+            
+            print("\nLength distribution (bp):")
+            for line in format_histogram([row['length'] for row in stats],
+                                         LENGTH_BINS):
+                print(f"  {line}")
+            
+            print("GC content distribution:")
+            for line in format_histogram([row['gc_content'] for row in stats],
+                                         GC_BINS, fmt='{:.1f}'):
+                print(f"  {line}")
+            
+            with_n = sum(1 for row in stats if row['n_count'])
+            without_stop = sum(1 for row in stats if not row['ends_with_stop'])
+            with_internal = sum(1 for row in stats if row['internal_stops'])
+            print(f"Genes with N: {with_n}, without terminal stop: "
+                  f"{without_stop}, with internal stops: {with_internal}")
         print("\n✓ Program completed successfully!")
     
     except FileNotFoundError as e:
@@ -17,7 +17,15 @@ from extract_genes import (
     load_fasta,
     parse_gff,
     reverse_complement,
-    extract_gene_seqs
+    extract_gene_seqs,
+    write_fasta,
+    diff_genes,
+    load_manifest,
+    extract_incremental,
+    gene_stats,
+    stats_path_for,
+    write_stats,
+    format_histogram
 )
 
 
@@ -109,6 +117,7 @@ class TestParseGFF:
             assert result[0]['strand'] == '+'
             assert result[1]['name'] == 'crp'
             assert result[1]['strand'] == '-'
+            assert result[1]['id'] == 'gene2'
         finally:
             Path(f.name_temp).unlink()
     
@@ -293,6 +302,73 @@ class TestExtractGeneSeqs:
         assert 'gene_coords=1-5' in header
         assert 'strand=+' in header
 
+    def test_extract_gene_seqs_stats(self):
+        """Test: Métricas calculadas en la misma pasada de extracción"""
+        genome = {'chr1': 'ATGCGTACGATCGATCGATCGA'}
+        genes = [
+            {'seqid': 'chr1', 'start': 1, 'end': 5, 'strand': '+', 'name': 'short'},
+            {'seqid': 'chr1', 'start': 1, 'end': 15, 'strand': '+', 'name': 'long'}
+        ]
+        
+        stats = []
+        result = extract_gene_seqs(genome, genes, min_length=10, stats=stats)
+        assert len(stats) == len(result) == 1
+        assert stats[0]['name'] == 'long'
+        assert stats[0]['length'] == 15
+
+
+class TestGeneStats:
+    """Pruebas para gene_stats(), write_stats() y format_histogram()"""
+    
+    def test_gene_stats_basic(self):
+        """Test: Longitud, contenido GC y conteo de N"""
+        stats = gene_stats('gene1', 'ATGCNNGC')
+        assert stats['length'] == 8
+        assert stats['gc_content'] == 0.5
+        assert stats['n_count'] == 2
+    
+    def test_gene_stats_stop_codons(self):
+        """Test: Codón de terminación final y codones internos en marco"""
+        stats = gene_stats('gene1', 'ATGTAAGCCTGA')
+        assert stats['ends_with_stop'] is True
+        assert stats['internal_stops'] == 1
+        
+        stats = gene_stats('gene2', 'ATGTAAGC')
+        assert stats['ends_with_stop'] is False
+    
+    def test_gene_stats_out_of_frame_stop(self):
+        """Test: Codones de terminación fuera de marco no se cuentan"""
+        # TAA y TGA aparecen en los marcos +1 y +2, nunca en el marco 0
+        stats = gene_stats('gene1', 'CTAAGTGACCCGGG')
+        assert stats['internal_stops'] == 0
+        
+        stats = gene_stats('gene2', 'TAGTAGCCCTAG')
+        assert stats['internal_stops'] == 2
+        assert stats['ends_with_stop'] is True
+    
+    def test_stats_path_for(self):
+        """Test: El resumen se escribe junto al FASTA como <output>.stats.tsv"""
+        assert stats_path_for('results/genes.fna') == Path('results/genes.fna.stats.tsv')
+        assert stats_path_for('x.fna') != stats_path_for('x.fa')
+    
+    def test_write_stats(self):
+        """Test: Formato del archivo TSV de estadísticas"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            stats_file = Path(tmpdir) / 'out.stats.tsv'
+            write_stats(stats_file, [gene_stats('gene1', 'ATGTAA')])
+            lines = stats_file.read_text().splitlines()
+            assert lines[0].split('\t')[0] == 'name'
+            assert lines[1] == 'gene1\t6\t0.1667\t0\ttrue\t0'
+    
+    def test_format_histogram(self):
+        """Test: Conteos del histograma de texto"""
+        lines = format_histogram([10, 20, 500, 5000], (0, 300, 1000))
+        assert len(lines) == 3
+        assert lines[0].endswith(' 2')
+        assert lines[1].endswith(' 1')
+        assert lines[2].lstrip().startswith('>=1000')
+        assert lines[2].endswith(' 1')
+
 
 class TestIntegration:
     """Pruebas de integración completa"""
@@ -353,5 +429,184 @@ class TestIntegration:
             assert 'long' in result[0][0]
 
 
+class TestIncremental:
+    """Pruebas para el modo incremental (extract_incremental())"""
+    
+    def _write_inputs(self, tmpdir, gff_lines):
+        fasta_file = tmpdir / 'test.fasta'
+        if not fasta_file.exists():
+            with open(fasta_file, 'w') as f:
+                f.write(">chr1\n")
+                f.write("ATGCGTACGATCGATCGATCGATAA\n")
+        gff_file = tmpdir / 'test.gff'
+        with open(gff_file, 'w') as f:
+            f.writelines(gff_lines)
+        return fasta_file, parse_gff(str(gff_file))
+    
+    def test_incremental_matches_full_run(self):
+        """Test: La salida incremental es idéntica a la extracción completa"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            fasta_file, genes = self._write_inputs(tmpdir, [
+                "chr1\tRefSeq\tgene\t1\t10\t.\t+\t.\tID=gene1;Name=araC\n",
+                "chr1\tRefSeq\tgene\t11\t20\t.\t-\t.\tID=gene2;Name=crp\n",
+            ])
+            output = tmpdir / 'out.fna'
+            manifest = tmpdir / 'manifest.json'
+            
+            summary = extract_incremental(str(fasta_file), genes, output, manifest)
+            assert summary['added'] == 2
+            assert summary['reused'] == 0
+            
+            reference = tmpdir / 'ref.fna'
+            write_fasta(reference, extract_gene_seqs(load_fasta(str(fasta_file)), genes))
+            assert output.read_bytes() == reference.read_bytes()
+    
+    def test_incremental_reextracts_only_changes(self):
+        """Test: Solo se re-extraen genes nuevos o modificados"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            fasta_file, genes = self._write_inputs(tmpdir, [
+                "chr1\tRefSeq\tgene\t1\t10\t.\t+\t.\tID=gene1;Name=araC\n",
+                "chr1\tRefSeq\tgene\t11\t20\t.\t-\t.\tID=gene2;Name=crp\n",
+                "chr1\tRefSeq\tgene\t5\t15\t.\t+\t.\tID=gene3;Name=lacZ\n",
+            ])
+            output = tmpdir / 'out.fna'
+            manifest = tmpdir / 'manifest.json'
+            extract_incremental(str(fasta_file), genes, output, manifest)
+            
+            # crp cambia de strand, lacZ se elimina y se agrega tetR
+            _, genes = self._write_inputs(tmpdir, [
+                "chr1\tRefSeq\tgene\t1\t10\t.\t+\t.\tID=gene1;Name=araC\n",
+                "chr1\tRefSeq\tgene\t11\t20\t.\t+\t.\tID=gene2;Name=crp\n",
+                "chr1\tRefSeq\tgene\t21\t25\t.\t+\t.\tID=gene4;Name=tetR\n",
+            ])
+            summary = extract_incremental(str(fasta_file), genes, output, manifest)
+            assert summary == {'added': 1, 'changed': 1, 'removed': 1,
+                               'reused': 1, 'written': 3}
+            
+            reference = tmpdir / 'ref.fna'
+            write_fasta(reference, extract_gene_seqs(load_fasta(str(fasta_file)), genes))
+            assert output.read_bytes() == reference.read_bytes()
+    
+    def test_incremental_min_length_change_rebuilds(self):
+        """Test: Cambiar min_length invalida el manifiesto"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            fasta_file, genes = self._write_inputs(tmpdir, [
+                "chr1\tRefSeq\tgene\t1\t5\t.\t+\t.\tID=gene1;Name=short\n",
+                "chr1\tRefSeq\tgene\t1\t15\t.\t+\t.\tID=gene2;Name=long\n",
+            ])
+            output = tmpdir / 'out.fna'
+            manifest = tmpdir / 'manifest.json'
+            
+            summary = extract_incremental(str(fasta_file), genes, output, manifest,
+                                          min_length=10)
+            assert summary['written'] == 1
+            
+            summary = extract_incremental(str(fasta_file), genes, output, manifest)
+            assert summary['added'] == 2
+            assert summary['written'] == 2
+    
+    def test_incremental_duplicate_names_with_ids(self):
+        """Test: Genes con el mismo Name y distinto ID se identifican por ID"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            fasta_file, genes = self._write_inputs(tmpdir, [
+                "chr1\tRefSeq\tgene\t1\t10\t.\t+\t.\tID=trn1;Name=tRNA\n",
+                "chr1\tRefSeq\tgene\t11\t20\t.\t+\t.\tID=trn2;Name=tRNA\n",
+            ])
+            output = tmpdir / 'out.fna'
+            manifest = tmpdir / 'manifest.json'
+            extract_incremental(str(fasta_file), genes, output, manifest)
+            
+            _, genes = self._write_inputs(tmpdir, [
+                "chr1\tRefSeq\tgene\t1\t10\t.\t+\t.\tID=trn1;Name=tRNA\n",
+                "chr1\tRefSeq\tgene\t11\t21\t.\t+\t.\tID=trn2;Name=tRNA\n",
+            ])
+            summary = extract_incremental(str(fasta_file), genes, output, manifest)
+            assert summary['changed'] == 1
+            assert summary['reused'] == 1
+    
+    def test_incremental_output_rewritten(self):
+        """Test: Una salida reescrita fuera del modo incremental no se reutiliza"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            fasta_file, genes = self._write_inputs(tmpdir, [
+                "chr1\tRefSeq\tgene\t1\t10\t.\t+\t.\tID=gene1;Name=aaaa\n",
+                "chr1\tRefSeq\tgene\t11\t20\t.\t+\t.\tID=gene2;Name=bbbb\n",
+            ])
+            output = tmpdir / 'out.fna'
+            manifest = tmpdir / 'manifest.json'
+            extract_incremental(str(fasta_file), genes, output, manifest)
+            
+            # Misma salida en orden inverso: mismo tamaño, offsets distintos
+            genome = load_fasta(str(fasta_file))
+            write_fasta(output, extract_gene_seqs(genome, genes[::-1]))
+            
+            _, genes = self._write_inputs(tmpdir, [
+                "chr1\tRefSeq\tgene\t1\t10\t.\t+\t.\tID=gene1;Name=aaaa\n",
+                "chr1\tRefSeq\tgene\t11\t20\t.\t+\t.\tID=gene2;Name=bbbb\n",
+                "chr1\tRefSeq\tgene\t21\t25\t.\t+\t.\tID=gene3;Name=cccc\n",
+            ])
+            summary = extract_incremental(str(fasta_file), genes, output, manifest)
+            assert summary['reused'] == 0
+            
+            reference = tmpdir / 'ref.fna'
+            write_fasta(reference, extract_gene_seqs(genome, genes))
+            assert output.read_bytes() == reference.read_bytes()
+    
+    def test_load_manifest_stale(self):
+        """Test: Un manifiesto de otra versión o mal formado se ignora"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manifest = Path(tmpdir) / 'manifest.json'
+            manifest.write_text('{"version": 0, "genes": {}}')
+            assert load_manifest(manifest) is None
+            
+            manifest.write_text('{"version": 2, "genes": {"gene1": {"hash": "x"}}}')
+            assert load_manifest(manifest) is None
+            
+            manifest.write_text('not json')
+            assert load_manifest(manifest) is None
+    
+    def test_incremental_duplicate_ids(self):
+        """Test: IDs de genes duplicados deben lanzar ValueError"""
+        genes = [
+            {'seqid': 'chr1', 'start': 1, 'end': 5, 'strand': '+', 'name': 'dup'},
+            {'seqid': 'chr1', 'start': 6, 'end': 10, 'strand': '+', 'name': 'dup'}
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            with pytest.raises(ValueError, match="unique gene IDs"):
+                extract_incremental(tmpdir / 'g.fasta', genes, tmpdir / 'out.fna',
+                                    tmpdir / 'manifest.json')
+    
+    def test_incremental_stats_include_reused(self):
+        """Test: Las métricas incluyen genes reutilizados del FASTA anterior"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+            fasta_file, genes = self._write_inputs(tmpdir, [
+                "chr1\tRefSeq\tgene\t1\t10\t.\t+\t.\tID=gene1;Name=araC\n",
+                "chr1\tRefSeq\tgene\t11\t20\t.\t-\t.\tID=gene2;Name=crp\n",
+            ])
+            output = tmpdir / 'out.fna'
+            manifest = tmpdir / 'manifest.json'
+            
+            first = []
+            extract_incremental(str(fasta_file), genes, output, manifest, stats=first)
+            second = []
+            summary = extract_incremental(str(fasta_file), genes, output, manifest,
+                                          stats=second)
+            assert summary['reused'] == 2
+            assert first == second
+    
+    def test_diff_genes_without_manifest(self):
+        """Test: Sin manifiesto todos los genes son nuevos"""
+        genes = [
+            {'seqid': 'chr1', 'start': 1, 'end': 5, 'strand': '+', 'name': 'gene1'}
+        ]
+        assert diff_genes(genes, None) == (['gene1'], [], [])
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])